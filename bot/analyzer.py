@@ -1,12 +1,77 @@
 """Job posting analyzer for Ghana accessibility."""
 
 import re
+import unicodedata
+from functools import lru_cache
 from typing import Literal, Optional
+
+import ahocorasick
+
 from bot.claude_analyzer import ClaudeAnalyzer
 
 Verdict = Literal["helpful", "not_helpful", "visa_sponsorship", "unclear"]
 
 
+def _expand_pattern(pattern: str) -> Optional[list[str]]:
+    """
+    Expand a simple keyword regex into its literal string variants.
+
+    Handles the constructs used in the keyword lists: `\\s+` (one space after
+    whitespace normalization), escaped literals like `\\.`, and optional parts
+    like `(?:ship)?`, `s?` or `-?`. Returns None for patterns that need a real
+    regex engine (e.g. word boundaries), which stay in the residual lists.
+
+    Args:
+        pattern: The keyword regex pattern
+
+    Returns:
+        List of literal variants, or None if the pattern can't be expanded
+    """
+    variants = [""]
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+
+        if char == "\\":
+            escaped = pattern[i + 1]
+            if escaped == "s" and pattern[i + 2 : i + 3] == "+":
+                # \s+ collapses to a single space in normalized text
+                variants = [v + " " for v in variants]
+                i += 3
+            elif escaped in ".-":
+                variants = [v + escaped for v in variants]
+                i += 2
+            else:
+                # \b and friends need the regex engine
+                return None
+
+        elif pattern[i : i + 3] == "(?:":
+            # Optional group like (?:ship)? — find the closing paren
+            close = pattern.index(")", i)
+            if pattern[close + 1 : close + 2] != "?":
+                return None
+            inner = _expand_pattern(pattern[i + 3 : close])
+            if inner is None:
+                return None
+            variants = [v + suffix for v in variants for suffix in [""] + inner]
+            i = close + 2
+
+        elif pattern[i + 1 : i + 2] == "?":
+            # Optional single character like s? or -?
+            variants = [v + suffix for v in variants for suffix in ("", char)]
+            i += 2
+
+        elif char.isalnum() or char in " ":
+            variants = [v + char for v in variants]
+            i += 1
+
+        else:
+            # Any other metacharacter: fall back to the regex engine
+            return None
+
+    return variants
+
+
 class JobAnalyzer:
     """Analyzes job postings to determine Ghana accessibility."""
 
@@ -83,11 +148,68 @@ class JobAnalyzer:
     ]
 
     # Job boards that are typically worldwide remote
-    REMOTE_FIRST_DOMAINS = [
+    REMOTE_FIRST_DOMAINS = (
         'remoteok.com',
         'weworkremotely.com',
+    )
+
+    # Matching priority per category: lower wins when several keywords hit
+    _CATEGORIES = [
+        (0, "visa_sponsorship", "Offers visa sponsorship: '{}'"),
+        (1, "not_helpful", "Location restricted: '{}'"),
+        (2, "helpful", "Accessible: '{}'"),
     ]
 
+    # Single-pass keyword automaton, built once at module import
+    _automaton = None
+    _residual_patterns = None
+
+    # Ambiguous "remote" mention without location specifics
+    _REMOTE_RE = re.compile(r"\bremote\b")
+
+    @classmethod
+    def _build_automaton(cls):
+        """
+        Build the Aho-Corasick automaton over all keyword lists.
+
+        Each keyword regex is expanded into its literal variants and added
+        with a (priority, verdict, literal) payload so one pass over the
+        text finds the best match across all three categories. Patterns
+        that can't be expanded (e.g. `h-?1b`, `\\bghana\\b`) stay compiled
+        in a small residual regex list.
+        """
+        automaton = ahocorasick.Automaton()
+        residual = []
+
+        keyword_lists = [
+            cls.VISA_SPONSORSHIP_KEYWORDS,
+            cls.NOT_HELPFUL_KEYWORDS,
+            cls.HELPFUL_KEYWORDS,
+        ]
+        for (priority, verdict, _), keywords in zip(cls._CATEGORIES, keyword_lists):
+            unexpanded = []
+            for pattern in keywords:
+                variants = _expand_pattern(pattern)
+                if variants is None:
+                    unexpanded.append(pattern)
+                else:
+                    for literal in variants:
+                        # Earlier categories have higher priority; don't let a
+                        # duplicate literal from a later list overwrite them
+                        if literal not in automaton:
+                            automaton.add_word(literal, (priority, verdict, literal))
+
+            # Union each category's leftovers so they cost one scan, not one
+            # scan per pattern
+            if unexpanded:
+                union = re.compile("|".join(f"(?:{p})" for p in unexpanded))
+                residual.append((priority, verdict, union))
+
+        automaton.make_automaton()
+        cls._automaton = automaton
+        # Sorted by priority so matching can stop early once outranked
+        cls._residual_patterns = sorted(residual, key=lambda item: item[0])
+
     async def analyze(
         self,
         text: str,
@@ -105,8 +227,11 @@ class JobAnalyzer:
         Returns:
             Tuple of (verdict, reason)
         """
+        # Normalize each input once; both rule-based passes reuse the results
+        url_lower = url.lower()
+
         # Step 1: Try rule-based analysis on message text
-        verdict, reason = self._rule_based_analyze(text, url)
+        verdict, reason = _rule_analysis(self._normalize(text), url_lower)
 
         if verdict != "unclear":
             return verdict, reason
@@ -115,7 +240,9 @@ class JobAnalyzer:
         if scraped_data and scraped_data.get("scrape_success"):
             scraped_text = scraped_data.get("raw_text", "")
             if scraped_text:
-                verdict, reason = self._rule_based_analyze(scraped_text, url)
+                verdict, reason = self._analyze_normalized(
+                    self._normalize(scraped_text), url_lower
+                )
 
                 if verdict != "unclear":
                     return verdict, f"{reason} (from scraped content)"
@@ -127,12 +254,49 @@ class JobAnalyzer:
             if scraped_data and scraped_data.get("scrape_success"):
                 full_content += "\n\n" + scraped_data.get("raw_text", "")
 
-            verdict, reason = await self.claude_analyzer.analyze(full_content)
-            return verdict, f"{reason} (AI analysis)"
+            # Skip the API call when the content is obviously uninformative:
+            # Claude would only come back with "unclear" anyway
+            if self._worth_ai_analysis(full_content):
+                verdict, reason = await self.claude_analyzer.analyze(full_content)
+                return verdict, f"{reason} (AI analysis)"
 
         # Step 4: Return unclear if all else fails
         return verdict, reason
 
+    # Vocabulary that suggests the text actually describes a job
+    _JOB_VOCABULARY = (
+        "job", "role", "position", "engineer", "developer",
+        "remote", "hire", "hiring", "apply", "salary",
+    )
+
+    # Minimum content length worth sending to the AI tier
+    _MIN_AI_CONTENT_CHARS = 200
+
+    @classmethod
+    def _worth_ai_analysis(cls, content: str) -> bool:
+        """
+        Gate for the Claude tier: long enough to analyze and containing at
+        least some job-related vocabulary.
+
+        Args:
+            content: Combined message and scraped content
+
+        Returns:
+            True if an AI call is likely to produce a real verdict
+        """
+        if len(content.strip()) < cls._MIN_AI_CONTENT_CHARS:
+            return False
+        content_lower = content.lower()
+        return any(token in content_lower for token in cls._JOB_VOCABULARY)
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Canonicalize text for keyword matching: NFKC folds lookalike
+        codepoints (one-dot leaders, non-breaking spaces, fullwidth forms),
+        then lowercase and collapse whitespace so multi-word keywords match
+        across line breaks."""
+        return " ".join(unicodedata.normalize("NFKC", text).lower().split())
+
     def _rule_based_analyze(self, text: str, url: str = "") -> tuple[Verdict, str]:
         """
         Rule-based keyword analysis.
@@ -144,36 +308,50 @@ class JobAnalyzer:
         Returns:
             Tuple of (verdict, reason)
         """
-        text_lower = text.lower()
-        url_lower = url.lower()
+        return _rule_analysis(self._normalize(text), url.lower())
+
+    @classmethod
+    def _analyze_normalized(cls, text_lower: str, url_lower: str) -> tuple[Verdict, str]:
+        """
+        Keyword analysis over pre-normalized (lowercased, whitespace-collapsed)
+        text and a pre-lowercased URL.
+
+        Args:
+            text_lower: Normalized text to analyze
+            url_lower: Lowercased URL to check
 
+        Returns:
+            Tuple of (verdict, reason)
+        """
         # Check if URL is from a remote-first job board
-        if any(domain in url_lower for domain in self.REMOTE_FIRST_DOMAINS):
+        if any(domain in url_lower for domain in cls.REMOTE_FIRST_DOMAINS):
             return "helpful", "Posted on worldwide remote job board"
 
-        # Check for VISA SPONSORSHIP keywords first (highest priority for relocation)
-        for pattern in self.VISA_SPONSORSHIP_KEYWORDS:
-            if re.search(pattern, text_lower):
-                match = re.search(pattern, text_lower)
-                matched_text = match.group(0) if match else pattern
-                return "visa_sponsorship", f"Offers visa sponsorship: '{matched_text}'"
-
-        # Check for NOT HELPFUL keywords (stricter check)
-        for pattern in self.NOT_HELPFUL_KEYWORDS:
-            if re.search(pattern, text_lower):
-                match = re.search(pattern, text_lower)
-                matched_text = match.group(0) if match else pattern
-                return "not_helpful", f"Location restricted: '{matched_text}'"
-
-        # Check for HELPFUL keywords
-        for pattern in self.HELPFUL_KEYWORDS:
-            if re.search(pattern, text_lower):
-                match = re.search(pattern, text_lower)
-                matched_text = match.group(0) if match else pattern
-                return "helpful", f"Accessible: '{matched_text}'"
+        # Single pass over the text; keep the hit from the highest-priority
+        # category (visa > not_helpful > helpful)
+        best = None
+        for _, payload in cls._automaton.iter(text_lower):
+            if best is None or payload[0] < best[0]:
+                best = payload
+                if best[0] == 0:
+                    break
+
+        # Residual patterns that need the regex engine (word boundaries etc.).
+        # The list is sorted by priority, so once the automaton hit outranks
+        # the current pattern the rest can't improve on it either.
+        for priority, verdict, pattern in cls._residual_patterns:
+            if best is not None and best[0] <= priority:
+                break
+            if (match := pattern.search(text_lower)) is not None:
+                best = (priority, verdict, match.group(0))
+
+        if best is not None:
+            priority, verdict, matched_text = best
+            reason_template = cls._CATEGORIES[priority][2]
+            return verdict, reason_template.format(matched_text)
 
         # Check for ambiguous "remote" mention without specifics
-        if re.search(r"\bremote\b", text_lower):
+        if cls._REMOTE_RE.search(text_lower):
             # "Remote" alone is often US-remote, so mark as unclear
             return "unclear", "Mentions 'remote' but location requirements unclear"
 
@@ -181,6 +359,29 @@ class JobAnalyzer:
         return "unclear", "Cannot determine location requirements from text"
 
 
+# Build the keyword automaton once at import so no request pays for it
+JobAnalyzer._build_automaton()
+
+
+# Groups repost the same job text often; memoize verdicts for short texts.
+# Large scraped bodies stay uncached here - they're already cached per-URL
+# in JobCache, and keeping them out caps the memory held by the LRU.
+_RULE_CACHE_MAX_TEXT = 2048
+
+
+@lru_cache(maxsize=2048)
+def _cached_rule_analysis(text_lower: str, url_lower: str) -> tuple[Verdict, str]:
+    """Memoized wrapper around the keyword analysis for normalized inputs."""
+    return JobAnalyzer._analyze_normalized(text_lower, url_lower)
+
+
+def _rule_analysis(text_lower: str, url_lower: str) -> tuple[Verdict, str]:
+    """Route normalized text through the LRU when it's small enough."""
+    if len(text_lower) <= _RULE_CACHE_MAX_TEXT:
+        return _cached_rule_analysis(text_lower, url_lower)
+    return JobAnalyzer._analyze_normalized(text_lower, url_lower)
+
+
 # Emoji reactions for verdicts
 VERDICT_EMOJIS = {
     "helpful": "✅",
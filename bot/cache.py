@@ -3,12 +3,22 @@
 import sqlite3
 import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Write-behind tuning: flush after this many buffered rows or this many seconds
+_FLUSH_ROWS = 32
+_FLUSH_SECONDS = 2.0
+
+# Maximum entries held in the in-memory front cache
+_MEMORY_CACHE_SIZE = 4096
+
 
 @dataclass
 class CachedResult:
@@ -24,6 +34,20 @@ class CachedResult:
 class JobCache:
     """Caches job analysis results in SQLite database."""
 
+    _GET_SQL = """
+        SELECT url, verdict, reason, scraped_content, analyzed_at, expires_at
+        FROM job_cache
+        WHERE url_hash = ? AND expires_at > ?
+    """
+
+    _SET_SQL = """
+        INSERT OR REPLACE INTO job_cache
+        (url_hash, url, verdict, reason, scraped_content, analyzed_at, expires_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+
+    _CLEAR_EXPIRED_SQL = "DELETE FROM job_cache WHERE expires_at <= ?"
+
     def __init__(self, db_path: str = "job_cache.db", ttl_hours: int = 24):
         """
         Initialize the cache.
@@ -34,43 +58,113 @@ class JobCache:
         """
         self.db_path = db_path
         self.ttl_hours = ttl_hours
-        self._init_db()
 
-    def _init_db(self):
-        """Initialize the database schema."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS job_cache (
-                    url_hash TEXT PRIMARY KEY,
-                    url TEXT NOT NULL,
-                    verdict TEXT NOT NULL,
-                    reason TEXT NOT NULL,
-                    scraped_content TEXT,
-                    analyzed_at TIMESTAMP NOT NULL,
-                    expires_at TIMESTAMP NOT NULL
-                )
-            """)
+        # One long-lived connection; per-call connect/close costs more than
+        # the queries themselves. The lock serializes access across threads.
+        self._conn = sqlite3.connect(
+            db_path, check_same_thread=False, isolation_level=None
+        )
+        self._lock = threading.Lock()
 
-            # Create index for faster expiration checks
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_expires_at
-                ON job_cache(expires_at)
-            """)
+        # In-memory LRU front cache plus a write-behind buffer so each set()
+        # is a dict insert; rows are batched into one transaction per flush
+        self._memory_cache: OrderedDict[str, CachedResult] = OrderedDict()
+        self._write_buffer: list[tuple] = []
+        self._last_flush = time.monotonic()
 
-            conn.commit()
-            conn.close()
+        self._init_db()
 
-            logger.info(f"Cache database initialized at {self.db_path}")
+        self._stop_flusher = threading.Event()
+        self._flush_signal = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+
+    def _init_db(self):
+        """Initialize the database schema and connection pragmas."""
+        try:
+            with self._lock:
+                cursor = self._conn.cursor()
+
+                # WAL lets reads proceed while a write is in flight
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA temp_store=MEMORY")
+                cursor.execute("PRAGMA mmap_size=134217728")
+
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS job_cache (
+                        url_hash TEXT PRIMARY KEY,
+                        url TEXT NOT NULL,
+                        verdict TEXT NOT NULL,
+                        reason TEXT NOT NULL,
+                        scraped_content TEXT,
+                        analyzed_at TIMESTAMP NOT NULL,
+                        expires_at TIMESTAMP NOT NULL
+                    )
+                """)
+
+                # Create index for faster expiration checks
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_expires_at
+                    ON job_cache(expires_at)
+                """)
+
+            logger.info("Cache database initialized at %s", self.db_path)
 
         except Exception as e:
-            logger.error(f"Failed to initialize cache database: {e}")
+            logger.error("Failed to initialize cache database: %s", e)
 
     def _hash_url(self, url: str) -> str:
         """Generate a hash for a URL."""
-        return hashlib.sha256(url.encode()).hexdigest()
+        # Cache key only, no security requirement: blake2b with a 128-bit
+        # digest is considerably faster than sha256 on short URLs
+        return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+    def _remember(self, url_hash: str, result: CachedResult):
+        """Put a result into the in-memory LRU. Caller must hold the lock."""
+        self._memory_cache[url_hash] = result
+        self._memory_cache.move_to_end(url_hash)
+        while len(self._memory_cache) > _MEMORY_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)
+
+    def _flush_locked(self):
+        """Write buffered rows in one transaction. Caller must hold the lock."""
+        if not self._write_buffer:
+            return
+
+        rows, self._write_buffer = self._write_buffer, []
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.executemany(self._SET_SQL, rows)
+            self._conn.execute("COMMIT")
+            logger.debug("Flushed %s cached results to disk", len(rows))
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        finally:
+            self._last_flush = time.monotonic()
+
+    def _flush_loop(self):
+        """Background thread: flush the write buffer periodically, or sooner
+        when set() signals that the buffer has filled up."""
+        while not self._stop_flusher.is_set():
+            self._flush_signal.wait(_FLUSH_SECONDS)
+            self._flush_signal.clear()
+            try:
+                with self._lock:
+                    self._flush_locked()
+            except Exception as e:
+                logger.error("Error flushing cache write buffer: %s", e)
+
+    def close(self):
+        """Flush pending writes and stop the background flusher."""
+        self._stop_flusher.set()
+        self._flush_signal.set()
+        try:
+            with self._lock:
+                self._flush_locked()
+        except Exception as e:
+            logger.error("Error flushing cache on close: %s", e)
 
     def get(self, url: str) -> Optional[CachedResult]:
         """
@@ -84,34 +178,42 @@ class JobCache:
         """
         try:
             url_hash = self._hash_url(url)
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT url, verdict, reason, scraped_content, analyzed_at, expires_at
-                FROM job_cache
-                WHERE url_hash = ? AND expires_at > ?
-            """, (url_hash, datetime.now()))
-
-            row = cursor.fetchone()
-            conn.close()
+            now = datetime.now()
+
+            with self._lock:
+                # In-memory front cache: hot working set never touches SQLite
+                entry = self._memory_cache.get(url_hash)
+                if entry is not None:
+                    if entry.expires_at > now:
+                        self._memory_cache.move_to_end(url_hash)
+                        logger.info("Cache HIT for %s (memory)", url)
+                        return entry
+                    del self._memory_cache[url_hash]
+
+                cursor = self._conn.cursor()
+                cursor.execute(self._GET_SQL, (url_hash, now))
+                row = cursor.fetchone()
+
+                if row:
+                    result = CachedResult(
+                        url=row[0],
+                        verdict=row[1],
+                        reason=row[2],
+                        scraped_content=row[3] or "",
+                        analyzed_at=datetime.fromisoformat(row[4]),
+                        expires_at=datetime.fromisoformat(row[5])
+                    )
+                    self._remember(url_hash, result)
 
             if row:
-                logger.info(f"Cache HIT for {url}")
-                return CachedResult(
-                    url=row[0],
-                    verdict=row[1],
-                    reason=row[2],
-                    scraped_content=row[3] or "",
-                    analyzed_at=datetime.fromisoformat(row[4]),
-                    expires_at=datetime.fromisoformat(row[5])
-                )
+                logger.info("Cache HIT for %s", url)
+                return result
 
-            logger.info(f"Cache MISS for {url}")
+            logger.info("Cache MISS for %s", url)
             return None
 
         except Exception as e:
-            logger.error(f"Error getting cached result: {e}")
+            logger.error("Error getting cached result: %s", e)
             return None
 
     def set(self, url: str, verdict: str, reason: str, scraped_content: str = ""):
@@ -129,61 +231,64 @@ class JobCache:
             analyzed_at = datetime.now()
             expires_at = analyzed_at + timedelta(hours=self.ttl_hours)
 
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                INSERT OR REPLACE INTO job_cache
-                (url_hash, url, verdict, reason, scraped_content, analyzed_at, expires_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (url_hash, url, verdict, reason, scraped_content, analyzed_at, expires_at))
-
-            conn.commit()
-            conn.close()
+            result = CachedResult(
+                url=url,
+                verdict=verdict,
+                reason=reason,
+                scraped_content=scraped_content,
+                analyzed_at=analyzed_at,
+                expires_at=expires_at
+            )
+
+            with self._lock:
+                self._remember(url_hash, result)
+                self._write_buffer.append(
+                    (url_hash, url, verdict, reason, scraped_content,
+                     analyzed_at, expires_at)
+                )
+                # Never flush on the caller: wake the background thread so
+                # the transaction cost stays off the hot path
+                if len(self._write_buffer) >= _FLUSH_ROWS:
+                    self._flush_signal.set()
 
-            logger.info(f"Cached result for {url}: {verdict}")
+            logger.info("Cached result for %s: %s", url, verdict)
 
         except Exception as e:
-            logger.error(f"Error caching result: {e}")
+            logger.error("Error caching result: %s", e)
 
     def clear_expired(self):
         """Remove expired cache entries."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                DELETE FROM job_cache
-                WHERE expires_at <= ?
-            """, (datetime.now(),))
-
-            deleted_count = cursor.rowcount
-            conn.commit()
-            conn.close()
+            now = datetime.now()
+            with self._lock:
+                self._flush_locked()
+                for url_hash in [
+                    h for h, r in self._memory_cache.items() if r.expires_at <= now
+                ]:
+                    del self._memory_cache[url_hash]
+                cursor = self._conn.execute(self._CLEAR_EXPIRED_SQL, (now,))
+                deleted_count = cursor.rowcount
 
             if deleted_count > 0:
-                logger.info(f"Cleared {deleted_count} expired cache entries")
+                logger.info("Cleared %s expired cache entries", deleted_count)
 
         except Exception as e:
-            logger.error(f"Error clearing expired cache: {e}")
+            logger.error("Error clearing expired cache: %s", e)
 
     def clear_all(self):
         """Remove all cache entries."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self._lock:
+                self._flush_locked()
+                self._memory_cache.clear()
+                cursor = self._conn.execute("DELETE FROM job_cache")
+                deleted_count = cursor.rowcount
 
-            cursor.execute("DELETE FROM job_cache")
-
-            deleted_count = cursor.rowcount
-            conn.commit()
-            conn.close()
-
-            logger.info(f"Cleared all {deleted_count} cache entries")
+            logger.info("Cleared all %s cache entries", deleted_count)
             return deleted_count
 
         except Exception as e:
-            logger.error(f"Error clearing all cache: {e}")
+            logger.error("Error clearing all cache: %s", e)
             return 0
 
     def get_stats(self) -> dict:
@@ -194,27 +299,30 @@ class JobCache:
             Dictionary with cache stats
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            now = datetime.now()
 
-            # Total entries
-            cursor.execute("SELECT COUNT(*) FROM job_cache")
-            total = cursor.fetchone()[0]
+            with self._lock:
+                self._flush_locked()
+                cursor = self._conn.cursor()
 
-            # Active (not expired) entries
-            cursor.execute("SELECT COUNT(*) FROM job_cache WHERE expires_at > ?", (datetime.now(),))
-            active = cursor.fetchone()[0]
+                # Total entries
+                cursor.execute("SELECT COUNT(*) FROM job_cache")
+                total = cursor.fetchone()[0]
 
-            # Verdict breakdown
-            cursor.execute("""
-                SELECT verdict, COUNT(*)
-                FROM job_cache
-                WHERE expires_at > ?
-                GROUP BY verdict
-            """, (datetime.now(),))
-            verdicts = dict(cursor.fetchall())
+                # Active (not expired) entries
+                cursor.execute(
+                    "SELECT COUNT(*) FROM job_cache WHERE expires_at > ?", (now,)
+                )
+                active = cursor.fetchone()[0]
 
-            conn.close()
+                # Verdict breakdown
+                cursor.execute("""
+                    SELECT verdict, COUNT(*)
+                    FROM job_cache
+                    WHERE expires_at > ?
+                    GROUP BY verdict
+                """, (now,))
+                verdicts = dict(cursor.fetchall())
 
             return {
                 "total_entries": total,
@@ -224,5 +332,5 @@ class JobCache:
             }
 
         except Exception as e:
-            logger.error(f"Error getting cache stats: {e}")
+            logger.error("Error getting cache stats: %s", e)
             return {}
@@ -1,11 +1,57 @@
 """Claude API integration for smart job analysis."""
 
 import logging
+import re
 from typing import Optional, Tuple
-from anthropic import Anthropic, AnthropicError
+from anthropic import AsyncAnthropic, AnthropicError
 
 logger = logging.getLogger(__name__)
 
+# One-pass parser for Claude's "VERDICT: ... / REASON: ..." reply format;
+# the reason capture stops at its line end so any trailing chatter is dropped
+_RESPONSE_RE = re.compile(
+    r"VERDICT:\s*(?P<verdict>[\[\]A-Z_ ]+?)\s*$(?:.*?REASON:[ \t]*(?P<reason>[^\n]+))?",
+    re.DOTALL | re.MULTILINE,
+)
+
+# Exact-token verdict mapping (substring checks let "NOT_HELPFUL" shadow "HELPFUL")
+_VERDICT_MAP = {
+    "HELPFUL": "helpful",
+    "NOT_HELPFUL": "not_helpful",
+    "NOT HELPFUL": "not_helpful",
+    "VISA_SPONSORSHIP": "visa_sponsorship",
+    "VISA SPONSORSHIP": "visa_sponsorship",
+}
+
+# Static prompt template; only the job content varies per call
+_PROMPT_TEMPLATE = """Analyze this job posting for someone located in Ghana, Africa.
+
+Determine if they can apply. Answer with ONE of:
+- HELPFUL: Job is available to Ghana residents (worldwide remote, Africa included, or Ghana-based)
+- VISA_SPONSORSHIP: Job offers visa sponsorship/relocation assistance (even if initially location-restricted)
+- NOT_HELPFUL: Job is restricted to locations that exclude Ghana AND no visa sponsorship offered
+- UNCLEAR: Cannot determine from the information provided
+
+Consider:
+- "Remote" alone often means US-remote unless specified
+- Timezone requirements (WAT/GMT is Ghana's timezone, GMT+0)
+- Visa/work authorization/sponsorship (H-1B, work permits, immigration support, relocation packages)
+- Company location vs job location
+- Explicit location restrictions
+- Even if job requires specific location initially, visa sponsorship makes it accessible
+
+IMPORTANT: If visa sponsorship or relocation assistance is mentioned, choose VISA_SPONSORSHIP even if there are location restrictions.
+
+Job Details:
+{job_content}
+
+Answer in format:
+VERDICT: [HELPFUL/VISA_SPONSORSHIP/NOT_HELPFUL/UNCLEAR]
+REASON: [One sentence explanation]"""
+
+# Pre-split so building a prompt is one three-part concat, not a template render
+_PROMPT_HEAD, _PROMPT_TAIL = _PROMPT_TEMPLATE.split("{job_content}")
+
 
 class ClaudeAnalyzer:
     """Uses Claude API for intelligent job analysis."""
@@ -18,7 +64,7 @@ class ClaudeAnalyzer:
             api_key: Anthropic API key (optional)
         """
         self.api_key = api_key
-        self.client = Anthropic(api_key=api_key) if api_key else None
+        self.client = AsyncAnthropic(api_key=api_key) if api_key else None
 
     def is_available(self) -> bool:
         """Check if Claude API is available."""
@@ -43,8 +89,8 @@ class ClaudeAnalyzer:
         try:
             prompt = self._build_prompt(job_content)
 
-            # Call Claude API
-            message = self.client.messages.create(
+            # Call Claude API without blocking the event loop
+            message = await self.client.messages.create(
                 model="claude-sonnet-4-20250514",
                 max_tokens=300,
                 messages=[
@@ -56,48 +102,26 @@ class ClaudeAnalyzer:
             response_text = message.content[0].text
             verdict, reason = self._parse_response(response_text)
 
-            logger.info(f"Claude analysis: {verdict} - {reason[:50]}...")
+            logger.info("Claude analysis: %s - %s...", verdict, reason[:50])
             return verdict, reason
 
         except AnthropicError as e:
-            logger.error(f"Claude API error: {e}")
+            logger.error("Claude API error: %s", e)
             return "unclear", f"AI analysis failed: {str(e)[:50]}"
 
         except Exception as e:
-            logger.error(f"Unexpected error in Claude analysis: {e}")
+            logger.error("Unexpected error in Claude analysis: %s", e)
             return "unclear", "AI analysis encountered an error"
 
     def _build_prompt(self, job_content: str) -> str:
         """Build the analysis prompt for Claude."""
-        # Truncate content if too long (to avoid token limits)
+        # Truncate content if too long (to avoid token limits); within the
+        # limit the original string is used as-is, no copy
         max_chars = 8000
         if len(job_content) > max_chars:
             job_content = job_content[:max_chars] + "...[truncated]"
 
-        return f"""Analyze this job posting for someone located in Ghana, Africa.
-
-Determine if they can apply. Answer with ONE of:
-- HELPFUL: Job is available to Ghana residents (worldwide remote, Africa included, or Ghana-based)
-- VISA_SPONSORSHIP: Job offers visa sponsorship/relocation assistance (even if initially location-restricted)
-- NOT_HELPFUL: Job is restricted to locations that exclude Ghana AND no visa sponsorship offered
-- UNCLEAR: Cannot determine from the information provided
-
-Consider:
-- "Remote" alone often means US-remote unless specified
-- Timezone requirements (WAT/GMT is Ghana's timezone, GMT+0)
-- Visa/work authorization/sponsorship (H-1B, work permits, immigration support, relocation packages)
-- Company location vs job location
-- Explicit location restrictions
-- Even if job requires specific location initially, visa sponsorship makes it accessible
-
-IMPORTANT: If visa sponsorship or relocation assistance is mentioned, choose VISA_SPONSORSHIP even if there are location restrictions.
-
-Job Details:
-{job_content}
-
-Answer in format:
-VERDICT: [HELPFUL/VISA_SPONSORSHIP/NOT_HELPFUL/UNCLEAR]
-REASON: [One sentence explanation]"""
+        return _PROMPT_HEAD + job_content + _PROMPT_TAIL
 
     def _parse_response(self, response: str) -> Tuple[str, str]:
         """
@@ -110,31 +134,17 @@ REASON: [One sentence explanation]"""
             Tuple of (verdict, reason)
         """
         try:
-            lines = response.strip().split("\n")
-
-            verdict_line = ""
-            reason_line = ""
-
-            for line in lines:
-                if line.startswith("VERDICT:"):
-                    verdict_line = line.replace("VERDICT:", "").strip().upper()
-                elif line.startswith("REASON:"):
-                    reason_line = line.replace("REASON:", "").strip()
-
-            # Map verdict to our format
-            if "VISA_SPONSORSHIP" in verdict_line or "VISA SPONSORSHIP" in verdict_line:
-                verdict = "visa_sponsorship"
-            elif "HELPFUL" in verdict_line and "NOT" not in verdict_line:
-                verdict = "helpful"
-            elif "NOT_HELPFUL" in verdict_line or "NOT HELPFUL" in verdict_line:
-                verdict = "not_helpful"
-            else:
-                verdict = "unclear"
+            match = _RESPONSE_RE.search(response)
+            if match is None:
+                return "unclear", "Could not parse AI analysis"
 
-            reason = reason_line if reason_line else "Analysis completed"
+            token = match.group("verdict").strip("[] ").upper()
+            verdict = _VERDICT_MAP.get(token, "unclear")
+            reason = match.group("reason")
+            reason = reason.strip() if reason else "Analysis completed"
 
             return verdict, reason
 
         except Exception as e:
-            logger.error(f"Error parsing Claude response: {e}")
+            logger.error("Error parsing Claude response: %s", e)
             return "unclear", "Could not parse AI analysis"
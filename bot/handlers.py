@@ -1,7 +1,14 @@
 """Message handlers for the Ghana Jobs Bot."""
 
+import asyncio
 import logging
 import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit
+
+import ahocorasick
 from telegram import Update
 from telegram.ext import ContextTypes
 
@@ -12,11 +19,107 @@ from bot.cache import JobCache
 
 logger = logging.getLogger(__name__)
 
+# Regex pattern to match URLs, compiled once at import; trailing sentence
+# punctuation is trimmed after matching
+_URL_RE = re.compile(r'https?://[^\s<>"\'`\[\]]+')
+_URL_TRAILING_PUNCT = ".,);:!?"
+
+# Single-pass substring matcher over all known job-site domains
+_JOB_DOMAIN_AC = ahocorasick.Automaton()
+for _domain in JOB_DOMAINS:
+    _JOB_DOMAIN_AC.add_word(_domain, _domain)
+_JOB_DOMAIN_AC.make_automaton()
+
 # Initialize modules
 analyzer = JobAnalyzer(claude_api_key=ANTHROPIC_API_KEY)
 scraper = JobScraper()
 cache = JobCache(db_path=CACHE_DB_PATH, ttl_hours=CACHE_TTL_HOURS)
 
+# Known tracking query parameters; anything else (gh_jid, Indeed's jk,
+# LinkedIn's currentJobId, ...) may identify the posting and must survive
+_TRACKING_QUERY_KEYS = frozenset((
+    "gh_src", "lever-source", "fbclid", "gclid", "msclkid",
+    "ref", "refid", "source", "src", "trk",
+))
+_TRACKING_QUERY_PREFIX = "utm_"
+
+
+@lru_cache(maxsize=2048)
+def _canonical_url(url: str) -> str:
+    """Canonicalize a job URL so tracking-param variants share one cache key."""
+    try:
+        parts = urlsplit(url)
+        query = ""
+        if parts.query:
+            kept = [
+                pair for pair in parts.query.split("&")
+                if (key := pair.split("=", 1)[0]) not in _TRACKING_QUERY_KEYS
+                and not key.startswith(_TRACKING_QUERY_PREFIX)
+            ]
+            query = "&".join(kept)
+        return urlunsplit((
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path.rstrip("/"),
+            query,
+            "",  # fragment never changes the posting
+        ))
+    except ValueError:
+        return url
+
+
+# Human-readable verdict labels, built once at import
+_VERDICT_LABELS = {v: v.replace("_", " ").title() for v in VERDICT_EMOJIS}
+
+# Boards where the URL alone decides the verdict: these sites only list
+# worldwide-remote roles, so scraping and analysis add nothing
+_URL_FASTPATH = (
+    ("remoteok.com", "helpful", "Known worldwide-remote board (RemoteOK)"),
+    ("weworkremotely.com", "helpful", "Known worldwide-remote board (WeWorkRemotely)"),
+)
+
+
+def _fastpath_verdict(url: str) -> tuple[str, str] | None:
+    """Return (verdict, reason) when the host alone decides it, else None."""
+    host = urlsplit(url).netloc.lower()
+    for domain, verdict, reason in _URL_FASTPATH:
+        if host == domain or host.endswith("." + domain):
+            return verdict, reason
+    return None
+
+
+# Negative cache for URLs whose scrape failed: re-pastes within the TTL are
+# answered as "unclear" without a new fetch, but the short window means a
+# transiently-down site is retried long before the 24h result cache would
+_FAILED_URL_TTL = 3600.0
+_FAILED_URL_MAX = 4096
+_failed_urls: OrderedDict[str, float] = OrderedDict()
+
+
+def _recent_failure(url: str) -> bool:
+    """Check whether a URL failed to scrape within the negative-cache TTL."""
+    expires = _failed_urls.get(url)
+    if expires is None:
+        return False
+    if expires <= time.monotonic():
+        del _failed_urls[url]
+        return False
+    return True
+
+
+def _remember_failure(url: str) -> None:
+    """Record a scrape failure, evicting the oldest entries past the cap."""
+    _failed_urls[url] = time.monotonic() + _FAILED_URL_TTL
+    _failed_urls.move_to_end(url)
+    while len(_failed_urls) > _FAILED_URL_MAX:
+        _failed_urls.popitem(last=False)
+
+# Cap concurrent scrape pipelines spawned from group messages
+_scrape_semaphore = asyncio.Semaphore(8)
+
+# Keep strong references to fire-and-forget tasks until they finish
+_background_tasks: set[asyncio.Task] = set()
+
 
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle the /start command."""
@@ -79,32 +182,60 @@ async def check_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         )
         return
 
-    url = context.args[0]
+    url = _canonical_url(context.args[0])
     message_text = " ".join(context.args)
 
     try:
-        # 1. Check cache first
-        cached = cache.get(url)
+        # 0. URL-decided boards skip the cache, scrape, and analyzer entirely
+        fastpath = _fastpath_verdict(url)
+        if fastpath:
+            verdict, reason = fastpath
+            emoji = VERDICT_EMOJIS[verdict]
+            response = f"{emoji} **{_VERDICT_LABELS[verdict]}**\n\n{reason}"
+            await update.message.reply_text(response, parse_mode="Markdown")
+            return
+
+        if _recent_failure(url):
+            logger.info("Skipping recently failed URL %s", url)
+            await update.message.reply_text(
+                "❓ Could not fetch this page recently; try again later"
+            )
+            return
+
+        # 1. Overlap the cache lookup with the scrape: the fetch dominates
+        # latency on a MISS, and a HIT just cancels the in-flight request
+        cache_task = asyncio.create_task(asyncio.to_thread(cache.get, url))
+        scrape_task = asyncio.create_task(scraper.scrape(url))
+
+        cached = await cache_task
         if cached:
-            logger.info(f"Using cached result for {url}")
+            scrape_task.cancel()
+            logger.info("Using cached result for %s", url)
             verdict, reason = cached.verdict, cached.reason + " (cached)"
         else:
-            # 2. Try scraping
-            logger.info(f"Scraping {url}...")
-            scraped_data = await scraper.scrape(url)
+            # 2. Wait for scraping
+            logger.info("Scraping %s...", url)
+            scraped_data = await scrape_task
 
             # 3. Analyze
             verdict, reason = await analyzer.analyze(message_text, url, scraped_data)
 
-            # 4. Cache the result
-            cache.set(url, verdict, reason, scraped_data.get("raw_text", ""))
+            # 4. Cache the result; failed fetches go to the short-TTL
+            # negative cache instead so a transient outage isn't pinned
+            # to "unclear" for a whole day
+            if scraped_data.get("scrape_success"):
+                await asyncio.to_thread(
+                    cache.set, url, verdict, reason, scraped_data.get("raw_text", "")
+                )
+            else:
+                _remember_failure(url)
 
         emoji = VERDICT_EMOJIS[verdict]
-        response = f"{emoji} **{verdict.replace('_', ' ').title()}**\n\n{reason}"
+        response = f"{emoji} **{_VERDICT_LABELS[verdict]}**\n\n{reason}"
         await update.message.reply_text(response, parse_mode="Markdown")
 
     except Exception as e:
-        logger.error(f"Error in check command: {e}")
+        logger.error("Error in check command: %s", e)
         await update.message.reply_text(f"❓ Error analyzing job: {str(e)[:100]}")
 
 
@@ -112,13 +243,13 @@ async def clearcache_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
     """Handle the /clearcache command to clear all cached results."""
     try:
         # Get stats before clearing
-        stats = cache.get_stats()
+        stats = await asyncio.to_thread(cache.get_stats)
         active_count = stats.get("active_entries", 0)
 
         # Clear all cache entries
-        deleted_count = cache.clear_all()
+        deleted_count = await asyncio.to_thread(cache.clear_all)
 
-        logger.info(f"Cache cleared by user: {deleted_count} entries removed")
+        logger.info("Cache cleared by user: %s entries removed", deleted_count)
         await update.message.reply_text(
             f"✅ **Cache Cleared**\n\n"
             f"Removed {deleted_count} cached results.\n"
@@ -126,7 +257,7 @@ async def clearcache_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
             parse_mode="Markdown"
         )
     except Exception as e:
-        logger.error(f"Error clearing cache: {e}")
+        logger.error("Error clearing cache: %s", e)
         await update.message.reply_text(f"❌ Error clearing cache: {str(e)[:100]}")
 
 
@@ -137,61 +268,121 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
     message_text = update.message.text
 
-    # Extract URLs from message
-    urls = extract_urls(message_text)
-
-    if not urls:
-        return  # No URLs found, ignore message
+    # Fast reject: most group messages contain no URL at all, and a substring
+    # test is much cheaper than running the regex
+    if "http" not in message_text:
+        return
 
-    # Check if any URL is from a known job site
-    job_urls = [url for url in urls if is_job_url(url)]
+    # Collect every distinct job-site URL in the message
+    job_urls = []
+    for match in _URL_RE.finditer(message_text):
+        url = _canonical_url(match.group(0).rstrip(_URL_TRAILING_PUNCT))
+        if url not in job_urls and is_job_url(url):
+            job_urls.append(url)
 
     if not job_urls:
-        return  # No job URLs found
+        return  # No job URLs found, ignore message
+
+    # Fire-and-forget: the only user-visible output is the emoji reaction,
+    # so return immediately and let the pipeline run as its own task
+    task = asyncio.create_task(_process_job(update, job_urls, message_text))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def _analyze_url(job_url: str, message_text: str) -> str:
+    """Run the cache/scrape/analyze pipeline for one URL; return the verdict."""
+    # URL-decided boards never need the pipeline (or the semaphore slot)
+    fastpath = _fastpath_verdict(job_url)
+    if fastpath:
+        logger.info("URL fast-path for %s: %s", job_url, fastpath[0])
+        return fastpath[0]
+
+    if _recent_failure(job_url):
+        logger.info("Skipping recently failed URL %s", job_url)
+        return "unclear"
+
+    async with _scrape_semaphore:
+        # 1. Overlap the cache lookup with the scrape: the fetch dominates
+        # latency on a MISS, and a HIT just cancels the in-flight request
+        cache_task = asyncio.create_task(asyncio.to_thread(cache.get, job_url))
+        scrape_task = asyncio.create_task(scraper.scrape(job_url))
+
+        cached = await cache_task
+        if cached:
+            scrape_task.cancel()
+            logger.info("Cache HIT for %s", job_url)
+            return cached.verdict
 
-    # Analyze the first job URL
-    job_url = job_urls[0]
-    logger.info(f"Analyzing job URL: {job_url}")
+        logger.info("Cache MISS for %s - scraping...", job_url)
 
-    try:
-        # 1. Check cache first
-        cached = cache.get(job_url)
-        if cached:
-            logger.info(f"Cache HIT for {job_url}")
-            verdict = cached.verdict
+        # 2. Wait for scraping
+        scraped_data = await scrape_task
+
+        # 3. Analyze (rule-based + Claude if needed)
+        verdict, reason = await analyzer.analyze(message_text, job_url, scraped_data)
+
+        logger.info("Verdict: %s - %s", verdict, reason)
+
+        # 4. Cache the result; failed fetches go to the short-TTL negative
+        # cache instead so a transient outage isn't pinned for a whole day
+        if scraped_data.get("scrape_success"):
+            await asyncio.to_thread(
+                cache.set, job_url, verdict, reason, scraped_data.get("raw_text", "")
+            )
         else:
-            logger.info(f"Cache MISS for {job_url} - scraping...")
+            _remember_failure(job_url)
+        return verdict
+
 
-            # 2. Try scraping
-            scraped_data = await scraper.scrape(job_url)
+# Aggregation order for multi-URL messages: react with the worst verdict so
+# a single emoji never oversells a message that mixes good and bad links
+_VERDICT_SEVERITY = ("not_helpful", "unclear", "visa_sponsorship", "helpful")
 
-            # 3. Analyze (rule-based + Claude if needed)
-            verdict, reason = await analyzer.analyze(message_text, job_url, scraped_data)
 
-            logger.info(f"Verdict: {verdict} - {reason}")
+async def _process_job(update: Update, job_urls: list[str], message_text: str) -> None:
+    """Analyze all job URLs concurrently and react with the aggregate emoji."""
+    try:
+        logger.info("Analyzing %s job URL(s): %s", len(job_urls), job_urls)
+
+        results = await asyncio.gather(
+            *(_analyze_url(url, message_text) for url in job_urls),
+            return_exceptions=True,
+        )
 
-            # 4. Cache the result
-            cache.set(job_url, verdict, reason, scraped_data.get("raw_text", ""))
+        verdicts = set()
+        for url, result in zip(job_urls, results):
+            if isinstance(result, BaseException):
+                logger.error("Error analyzing %s: %s", url, result)
+                verdicts.add("unclear")
+            else:
+                verdicts.add(result)
 
-        # 5. React to the message with emoji
+        verdict = next(v for v in _VERDICT_SEVERITY if v in verdicts)
+
+        # React to the message with emoji
         emoji = VERDICT_EMOJIS[verdict]
         await update.message.set_reaction(emoji)
 
     except Exception as e:
-        logger.error(f"Error analyzing job: {e}", exc_info=True)
+        logger.error("Error analyzing job: %s", e, exc_info=True)
         # React with unclear emoji if analysis fails
         await update.message.set_reaction("❓")
 
 
 def extract_urls(text: str) -> list[str]:
     """Extract URLs from text."""
-    # Regex pattern to match URLs
-    url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-    urls = re.findall(url_pattern, text)
-    return urls
+    if "http" not in text:
+        return []
+    return [
+        m.group(0).rstrip(_URL_TRAILING_PUNCT) for m in _URL_RE.finditer(text)
+    ]
 
 
+@lru_cache(maxsize=8192)
 def is_job_url(url: str) -> bool:
-    """Check if URL is from a known job site."""
-    url_lower = url.lower()
-    return any(domain in url_lower for domain in JOB_DOMAINS)
+    """Check if URL is from a known job site.
+
+    Memoized: the same board links get pasted repeatedly in groups, and the
+    negative case (ordinary links) repeats even more."""
+    return next(_JOB_DOMAIN_AC.iter(url.lower()), None) is not None
@@ -5,7 +5,14 @@ from telegram import Update, BotCommand
 from telegram.ext import Application, CommandHandler, MessageHandler, filters
 
 from config.settings import TELEGRAM_BOT_TOKEN, LOG_LEVEL
-from bot.handlers import start_command, help_command, check_command, clearcache_command
+from bot.handlers import (
+    start_command,
+    help_command,
+    check_command,
+    clearcache_command,
+    scraper,
+    cache,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -27,13 +34,25 @@ async def post_init(application: Application) -> None:
     logger.info("Bot commands set successfully")
 
 
+async def post_shutdown(application: Application) -> None:
+    """Release shared resources on shutdown."""
+    await scraper.aclose()
+    logger.info("Scraper HTTP client closed")
+    cache.close()
+    logger.info("Cache flushed and closed")
+
+
 def main() -> None:
     """Start the bot."""
     logger.info("Starting Ghana Jobs Bot...")
 
     # Create the Application
     application = (
-        Application.builder().token(TELEGRAM_BOT_TOKEN).post_init(post_init).build()
+        Application.builder()
+        .token(TELEGRAM_BOT_TOKEN)
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .build()
     )
 
     # Register command handlers
@@ -1,13 +1,173 @@
 """Web scraper for job postings."""
 
+import html
 import logging
+import re
+from functools import partial
+
 import httpx
-from bs4 import BeautifulSoup
+from selectolax.parser import HTMLParser
 from typing import Optional
-from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Job board URLs whose ATS exposes a public JSON API
+_GREENHOUSE_URL_RE = re.compile(
+    r"https?://(?:boards|job-boards)\.greenhouse\.io/(?P<board>[^/?#]+)/jobs/(?P<job_id>\d+)"
+)
+_LEVER_URL_RE = re.compile(
+    r"https?://jobs(?:\.eu)?\.lever\.co/(?P<company>[^/?#]+)/(?P<posting_id>[0-9a-fA-F-]+)"
+)
+
+
+def _extract(tree: HTMLParser, selector: str) -> str:
+    """Return the text of the first node matching a CSS selector, or ""."""
+    node = tree.css_first(selector)
+    return node.text(strip=True) if node else ""
+
+
+# Boilerplate nodes that carry no job content; inline JSON/script blobs on
+# modern job pages are often larger than the visible text
+_BOILERPLATE_TAGS = [
+    "script", "style", "noscript", "svg", "nav", "footer", "header", "iframe"
+]
+
+
+def _full_text(tree: HTMLParser) -> str:
+    """Return all visible text of the document, space-separated."""
+    tree.strip_tags(_BOILERPLATE_TAGS)
+    body = tree.body
+    node = body if body is not None else tree.root
+    if node is None:
+        return ""
+    return " ".join(node.text(separator=" ", strip=True).split())
+
+
+def _job_text(title: str, company: str, location: str, description: str,
+              tree: HTMLParser) -> str:
+    """
+    Compose analysis text from the extracted fields, falling back to the
+    full document only when the description container wasn't found.
+    """
+    if description:
+        parts = (title, company, location, description)
+        return " ".join(part for part in parts if part)
+    return _full_text(tree)
+
+
+# Pure per-site extractors: each takes a parsed tree and returns the job
+# fields. Fetching and error handling live in JobScraper._scrape_html, so
+# there is exactly one try/except for all of them.
+
+def _extract_greenhouse_html(tree: HTMLParser) -> dict:
+    """Extract job fields from a Greenhouse posting page."""
+    title = _extract(tree, "h1.app-title")
+    company = _extract(tree, "span.company-name")
+    location = _extract(tree, "div.location")
+    description = _extract(tree, "div#content")
+    return {
+        "title": title,
+        "company": company,
+        "location": location,
+        "description": description,
+        "raw_text": _job_text(title, company, location, description, tree),
+    }
+
+
+def _extract_lever_html(tree: HTMLParser) -> dict:
+    """Extract job fields from a Lever posting page."""
+    title = _extract(tree, "h2.posting-headline")
+
+    # Company name lives in the og:site_name meta tag
+    company_elem = tree.css_first('meta[property="og:site_name"]')
+    company = company_elem.attributes.get("content", "") if company_elem else ""
+
+    location = _extract(tree, "div.posting-categories")
+    description = _extract(tree, "div.posting-description")
+    return {
+        "title": title,
+        "company": company,
+        "location": location,
+        "description": description,
+        "raw_text": _job_text(title, company, location, description, tree),
+    }
+
+
+def _extract_workable(tree: HTMLParser) -> dict:
+    """Extract job fields from a Workable posting page."""
+    title = _extract(tree, "h1")
+    company = _extract(tree, 'span[data-ui="company-name"]')
+    location = _extract(tree, 'span[data-ui="job-location"]')
+    description = _extract(tree, 'div[data-ui="job-description"]')
+    return {
+        "title": title,
+        "company": company,
+        "location": location,
+        "description": description,
+        "raw_text": _job_text(title, company, location, description, tree),
+    }
+
+
+def _extract_remoteok(tree: HTMLParser) -> dict:
+    """Extract job fields from a RemoteOK posting page."""
+    title = _extract(tree, 'h2[itemprop="title"]')
+    company = _extract(tree, 'h3[itemprop="name"]')
+    location = _extract(tree, "div.location") or "Worldwide Remote"
+    raw_text = _full_text(tree)
+    return {
+        "title": title,
+        "company": company,
+        "location": location,
+        "description": raw_text,
+        "raw_text": raw_text,
+    }
+
+
+def _extract_weworkremotely(tree: HTMLParser) -> dict:
+    """Extract job fields from a WeWorkRemotely posting page."""
+    title = _extract(tree, "h1.listing-headline")
+    company = _extract(tree, "h2.company-card-name")
+    raw_text = _full_text(tree)
+    return {
+        "title": title,
+        "company": company,
+        # Location (usually worldwide)
+        "location": "Worldwide Remote",
+        "description": raw_text,
+        "raw_text": raw_text,
+    }
+
+
+def _extract_generic(tree: HTMLParser) -> dict:
+    """Extract whatever job fields an unknown site exposes."""
+    # Try to extract title from h1 or title tag
+    title = _extract(tree, "h1") or _extract(tree, "title")
+    raw_text = _full_text(tree)
+    return {
+        "title": title,
+        "company": "",
+        "location": "",
+        "description": raw_text,
+        "raw_text": raw_text,
+    }
+
+
+# Browser-like request headers, frozen at import; httpx normalizes them once
+# at client construction and reuses them for every request
+_DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Cache-Control": "max-age=0"
+}
+
 
 class JobScraper:
     """Scrapes job postings from various job sites."""
@@ -20,19 +180,35 @@ class JobScraper:
             timeout: HTTP request timeout in seconds
         """
         self.timeout = timeout
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Cache-Control": "max-age=0"
-        }
+        self.headers = _DEFAULT_HEADERS
+
+        # One shared client: keepalive + HTTP/2 amortize TCP/TLS setup across
+        # scrapes against the same job boards
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            headers=self.headers,
+            http2=True,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+
+        # Domain substring -> site-specific scraper, checked in order.
+        # Greenhouse and Lever try their JSON APIs first; the rest are the
+        # shared fetch path with a per-site extractor bound in
+        self._routes = (
+            ("greenhouse.io", self._scrape_greenhouse),
+            ("lever.co", self._scrape_lever),
+            ("workable.com",
+             partial(self._scrape_html, extract=_extract_workable, site="Workable")),
+            ("remoteok",
+             partial(self._scrape_html, extract=_extract_remoteok, site="RemoteOK")),
+            ("weworkremotely.com",
+             partial(self._scrape_html, extract=_extract_weworkremotely, site="WeWorkRemotely")),
+        )
+
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        await self._client.aclose()
 
     async def scrape(self, url: str) -> dict:
         """
@@ -53,263 +229,117 @@ class JobScraper:
             }
         """
         try:
-            domain = urlparse(url).netloc.lower()
+            # Cheap netloc slice: scheme://host/... -> host
+            try:
+                domain = url.split("/", 3)[2].lower()
+            except IndexError:
+                domain = ""
 
             # Route to appropriate scraper based on domain
-            if "greenhouse.io" in domain:
-                return await self._scrape_greenhouse(url)
-            elif "lever.co" in domain:
-                return await self._scrape_lever(url)
-            elif "workable.com" in domain:
-                return await self._scrape_workable(url)
-            elif "remoteok" in domain:
-                return await self._scrape_remoteok(url)
-            elif "weworkremotely.com" in domain:
-                return await self._scrape_weworkremotely(url)
-            else:
-                # Generic scraper for unknown sites
-                return await self._scrape_generic(url)
-
-        except Exception as e:
-            logger.error(f"Error scraping {url}: {e}")
-            return self._empty_result()
-
-    async def _scrape_greenhouse(self, url: str) -> dict:
-        """Scrape Greenhouse job postings."""
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=self.headers, follow_redirects=True)
-                response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
+            for key, scrape_fn in self._routes:
+                if key in domain:
+                    return await scrape_fn(url)
 
-            # Extract title
-            title_elem = soup.find("h1", class_="app-title")
-            title = title_elem.get_text(strip=True) if title_elem else ""
-
-            # Extract company
-            company_elem = soup.find("span", class_="company-name")
-            company = company_elem.get_text(strip=True) if company_elem else ""
-
-            # Extract location
-            location_elem = soup.find("div", class_="location")
-            location = location_elem.get_text(strip=True) if location_elem else ""
-
-            # Extract description
-            content_elem = soup.find("div", id="content")
-            description = content_elem.get_text(separator=" ", strip=True) if content_elem else ""
-
-            # Get all text for analysis
-            raw_text = soup.get_text(separator=" ", strip=True)
-
-            logger.info(f"Successfully scraped Greenhouse job: {title}")
-
-            return {
-                "title": title,
-                "company": company,
-                "location": location,
-                "description": description,
-                "raw_text": raw_text,
-                "scrape_success": True
-            }
+            # Generic scraper for unknown sites
+            return await self._scrape_html(url, _extract_generic, "generic")
 
         except Exception as e:
-            logger.warning(f"Failed to scrape Greenhouse URL {url}: {e}")
+            logger.error("Error scraping %s: %s", url, e)
             return self._empty_result()
 
-    async def _scrape_lever(self, url: str) -> dict:
-        """Scrape Lever job postings."""
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=self.headers, follow_redirects=True)
-                response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Extract title
-            title_elem = soup.find("h2", class_="posting-headline")
-            title = title_elem.get_text(strip=True) if title_elem else ""
-
-            # Extract company (from meta tag or header)
-            company_elem = soup.find("meta", property="og:site_name")
-            company = company_elem.get("content", "") if company_elem else ""
-
-            # Extract location
-            location_elem = soup.find("div", class_="posting-categories")
-            location = location_elem.get_text(strip=True) if location_elem else ""
-
-            # Extract description
-            content_elem = soup.find("div", class_="posting-description")
-            description = content_elem.get_text(separator=" ", strip=True) if content_elem else ""
+    async def _fetch(self, url: str) -> bytes:
+        """Fetch a URL and return the raw body bytes.
 
-            # Get all text
-            raw_text = soup.get_text(separator=" ", strip=True)
+        selectolax parses bytes directly, so skipping the bytes->str decode
+        avoids holding a second full copy of large pages."""
+        response = await self._client.get(url)
+        response.raise_for_status()
+        return response.content
 
-            logger.info(f"Successfully scraped Lever job: {title}")
-
-            return {
-                "title": title,
-                "company": company,
-                "location": location,
-                "description": description,
-                "raw_text": raw_text,
-                "scrape_success": True
-            }
-
-        except Exception as e:
-            logger.warning(f"Failed to scrape Lever URL {url}: {e}")
-            return self._empty_result()
+    async def _fetch_json(self, url: str) -> dict:
+        """Fetch a URL and return the parsed JSON body."""
+        response = await self._client.get(url)
+        response.raise_for_status()
+        return response.json()
 
-    async def _scrape_workable(self, url: str) -> dict:
-        """Scrape Workable job postings."""
+    async def _scrape_html(self, url: str, extract, site: str) -> dict:
+        """Fetch a page and run a pure extractor over the parsed tree."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=self.headers, follow_redirects=True)
-                response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Extract title
-            title_elem = soup.find("h1")
-            title = title_elem.get_text(strip=True) if title_elem else ""
-
-            # Extract company
-            company_elem = soup.find("span", {"data-ui": "company-name"})
-            company = company_elem.get_text(strip=True) if company_elem else ""
-
-            # Extract location
-            location_elem = soup.find("span", {"data-ui": "job-location"})
-            location = location_elem.get_text(strip=True) if location_elem else ""
-
-            # Extract description
-            description_elem = soup.find("div", {"data-ui": "job-description"})
-            description = description_elem.get_text(separator=" ", strip=True) if description_elem else ""
-
-            # Get all text
-            raw_text = soup.get_text(separator=" ", strip=True)
-
-            logger.info(f"Successfully scraped Workable job: {title}")
-
-            return {
-                "title": title,
-                "company": company,
-                "location": location,
-                "description": description,
-                "raw_text": raw_text,
-                "scrape_success": True
-            }
+            tree = HTMLParser(await self._fetch(url))
+            result = extract(tree)
+            result["scrape_success"] = True
+            logger.info("Successfully scraped %s job: %s", site, result["title"])
+            return result
 
         except Exception as e:
-            logger.warning(f"Failed to scrape Workable URL {url}: {e}")
+            logger.warning("Failed to scrape %s URL %s: %s", site, url, e)
             return self._empty_result()
 
-    async def _scrape_remoteok(self, url: str) -> dict:
-        """Scrape RemoteOK job postings."""
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=self.headers, follow_redirects=True)
-                response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Extract title
-            title_elem = soup.find("h2", itemprop="title")
-            title = title_elem.get_text(strip=True) if title_elem else ""
-
-            # Extract company
-            company_elem = soup.find("h3", itemprop="name")
-            company = company_elem.get_text(strip=True) if company_elem else ""
-
-            # Extract location
-            location_elem = soup.find("div", class_="location")
-            location = location_elem.get_text(strip=True) if location_elem else "Worldwide Remote"
-
-            # Get all text
-            raw_text = soup.get_text(separator=" ", strip=True)
-
-            logger.info(f"Successfully scraped RemoteOK job: {title}")
-
-            return {
-                "title": title,
-                "company": company,
-                "location": location,
-                "description": raw_text,
-                "raw_text": raw_text,
-                "scrape_success": True
-            }
-
-        except Exception as e:
-            logger.warning(f"Failed to scrape RemoteOK URL {url}: {e}")
-            return self._empty_result()
-
-    async def _scrape_weworkremotely(self, url: str) -> dict:
-        """Scrape WeWorkRemotely job postings."""
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=self.headers, follow_redirects=True)
-                response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Extract title
-            title_elem = soup.find("h1", class_="listing-headline")
-            title = title_elem.get_text(strip=True) if title_elem else ""
-
-            # Extract company
-            company_elem = soup.find("h2", class_="company-card-name")
-            company = company_elem.get_text(strip=True) if company_elem else ""
-
-            # Extract location (usually worldwide)
-            location = "Worldwide Remote"
-
-            # Get all text
-            raw_text = soup.get_text(separator=" ", strip=True)
-
-            logger.info(f"Successfully scraped WeWorkRemotely job: {title}")
-
-            return {
-                "title": title,
-                "company": company,
-                "location": location,
-                "description": raw_text,
-                "raw_text": raw_text,
-                "scrape_success": True
-            }
-
-        except Exception as e:
-            logger.warning(f"Failed to scrape WeWorkRemotely URL {url}: {e}")
-            return self._empty_result()
-
-    async def _scrape_generic(self, url: str) -> dict:
-        """Generic scraper for unknown sites."""
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=self.headers, follow_redirects=True)
-                response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Try to extract title from h1 or title tag
-            title_elem = soup.find("h1") or soup.find("title")
-            title = title_elem.get_text(strip=True) if title_elem else ""
-
-            # Get all visible text
-            raw_text = soup.get_text(separator=" ", strip=True)
-
-            logger.info(f"Generic scrape of {url}: extracted {len(raw_text)} chars")
-
-            return {
-                "title": title,
-                "company": "",
-                "location": "",
-                "description": raw_text,
-                "raw_text": raw_text,
-                "scrape_success": True
-            }
+    async def _scrape_greenhouse(self, url: str) -> dict:
+        """Scrape Greenhouse job postings, preferring the JSON boards API."""
+        match = _GREENHOUSE_URL_RE.match(url)
+        if match:
+            try:
+                data = await self._fetch_json(
+                    "https://boards-api.greenhouse.io/v1/boards/"
+                    f"{match['board']}/jobs/{match['job_id']}"
+                )
+
+                title = data.get("title", "")
+                company = data.get("company_name", "") or match["board"]
+                location = (data.get("location") or {}).get("name", "")
+
+                # "content" is HTML-escaped HTML
+                content_tree = HTMLParser(html.unescape(data.get("content", "")))
+                description = _full_text(content_tree)
+
+                logger.info("Scraped Greenhouse job via API: %s", title)
+
+                return {
+                    "title": title,
+                    "company": company,
+                    "location": location,
+                    "description": description,
+                    "raw_text": _job_text(title, company, location, description, content_tree),
+                    "scrape_success": True
+                }
+
+            except Exception as e:
+                logger.warning("Greenhouse API failed for %s, falling back to HTML: %s", url, e)
+
+        return await self._scrape_html(url, _extract_greenhouse_html, "Greenhouse")
 
-        except Exception as e:
-            logger.warning(f"Generic scrape failed for {url}: {e}")
-            return self._empty_result()
+    async def _scrape_lever(self, url: str) -> dict:
+        """Scrape Lever job postings, preferring the JSON postings API."""
+        match = _LEVER_URL_RE.match(url)
+        if match:
+            try:
+                data = await self._fetch_json(
+                    "https://api.lever.co/v0/postings/"
+                    f"{match['company']}/{match['posting_id']}"
+                )
+
+                title = data.get("text", "")
+                company = match["company"]
+                location = (data.get("categories") or {}).get("location", "")
+                description = data.get("descriptionPlain", "")
+
+                logger.info("Scraped Lever job via API: %s", title)
+
+                parts = (title, company, location, description)
+                return {
+                    "title": title,
+                    "company": company,
+                    "location": location,
+                    "description": description,
+                    "raw_text": " ".join(part for part in parts if part),
+                    "scrape_success": True
+                }
+
+            except Exception as e:
+                logger.warning("Lever API failed for %s, falling back to HTML: %s", url, e)
+
+        return await self._scrape_html(url, _extract_lever_html, "Lever")
 
     def _empty_result(self) -> dict:
         """Return empty result when scraping fails."""